@@ -1,14 +1,40 @@
-sql_query = """
-SELECT *
-FROM geographic_features
-LEFT JOIN weather_features USING (Field_ID)
-LEFT JOIN soil_and_crop_features USING (Field_ID)
-LEFT JOIN farm_management_features USING (Field_ID)
-"""
-
-# Create a connection object
-with engine.connect() as connection:
-    
-    # Use Pandas to execute the query and store the result in a DataFrame
-    MD_agric_df = pd.read_sql_query(text(sql_query), connection)
-    
+# Project the columns we actually use instead of SELECT * across four tables:
+# the index columns never cross the wire, the crop-type corrections and the
+# elevation sign fix run server-side, and pandas no longer has to drop
+# 'Unnamed: 0' or re-scan the frame afterwards.
+sql_query = """
+SELECT
+    g.Field_ID,
+    abs(g.Elevation) AS Elevation,
+    g.Latitude,
+    g.Longitude,
+    g.Location,
+    g.Slope,
+    w.Rainfall,
+    w.Min_temperature_C,
+    w.Max_temperature_C,
+    w.Ave_temps,
+    s.Soil_fertility,
+    s.Soil_type,
+    s.pH,
+    CASE TRIM(s.Crop_type)
+        WHEN 'cassaval' THEN 'cassava'
+        WHEN 'wheatn' THEN 'wheat'
+        WHEN 'teaa' THEN 'tea'
+        ELSE TRIM(s.Crop_type)
+    END AS Crop_type,
+    f.Pollution_level,
+    f.Plot_size,
+    f.Annual_yield,
+    f.Standard_yield
+FROM geographic_features g
+LEFT JOIN weather_features w USING (Field_ID)
+LEFT JOIN soil_and_crop_features s USING (Field_ID)
+LEFT JOIN farm_management_features f USING (Field_ID)
+"""
+
+# Create a connection object
+with engine.connect() as connection:
+
+    # Use Pandas to execute the query and store the result in a DataFrame
+    MD_agric_df = pd.read_sql_query(text(sql_query), connection)
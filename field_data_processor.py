@@ -1,4 +1,6 @@
 import logging
+import numpy as np
+import pandas as pd
 from data_ingestion import create_db_engine, query_data, read_from_web_CSV
 
 
@@ -32,6 +34,8 @@ class FieldDataProcessor:
         Parameters:
         - config_params (dict): A dictionary containing configuration parameters including
           'db_path', 'sql_query', 'columns_to_rename', 'values_to_rename', and 'weather_mapping_csv'.
+          An optional 'ingest_chunk_rows' key makes process() stream the SQL
+          result and transform it chunk-at-a-time with that many rows per chunk.
         - logging_level (str): The desired logging level for the class instance. Default is "INFO".
         """
         self.db_path = config_params["db_path"]
@@ -39,6 +43,7 @@ class FieldDataProcessor:
         self.columns_to_rename = config_params["columns_to_rename"]
         self.values_to_rename = config_params["values_to_rename"]
         self.weather_map_data = config_params["weather_mapping_csv"]
+        self.ingest_chunk_rows = config_params.get("ingest_chunk_rows")
 
         # Add the rest of your class code here
         self.initialize_logging(logging_level)
@@ -46,6 +51,8 @@ class FieldDataProcessor:
         # We create empty objects to store the DataFrame and engine in
         self.df = None
         self.engine = None
+        # Loaded lazily and kept so the chunked path reads the CSV only once
+        self._weather_mapping_df = None
 
     def initialize_logging(self, logging_level):
         """
@@ -92,68 +99,152 @@ class FieldDataProcessor:
         try:
             self.engine = create_db_engine(self.db_path)
             self.df = query_data(self.engine, self.sql_query)
+            # Shed the exported CSV index column at selection time so no
+            # later step ever sees it; queries that already project explicit
+            # columns are unaffected
+            self.df = self.df.drop(columns="Unnamed: 0", errors="ignore")
             self.logger.info("Successfully loaded data.")
             return self.df
         except Exception as e:
             self.logger.error(f"Failed to load data from SQL database. Error: {e}")
             raise
 
-    def rename_columns(self):
+    def rename_columns(self, df=None):
         """
         Rename specified columns in the DataFrame.
+
+        Parameters:
+        - df (pandas.DataFrame, optional): The frame to operate on. Defaults
+          to the instance DataFrame.
         """
+        target = self.df if df is None else df
         # Extract the columns to rename from the configuration
         column1, column2 = (
             list(self.columns_to_rename.keys())[0],
             list(self.columns_to_rename.values())[0],
         )
 
-        # Temporarily rename one of the columns to avoid a naming conflict
-        temp_name = "__temp_name_for_swap__"
-        while temp_name in self.df.columns:
-            temp_name += "_"
-
-        # Perform the swap
-        self.df = self.df.rename(columns={column1: temp_name, column2: column1})
-        self.df = self.df.rename(columns={temp_name: column2})
+        # Build the swapped header in one pass and assign it directly; rename
+        # would copy the whole frame twice and needs a temp name to avoid a
+        # conflict, while relabelling the axis touches no data at all
+        swap = {column1: column2, column2: column1}
+        target.columns = [swap.get(col, col) for col in target.columns]
 
         self.logger.info(f"Swapped columns: {column1} with {column2}")
+        return target
 
-    def apply_corrections(self, column_name="Crop_type", abs_column="Elevation"):
+    def apply_corrections(self, column_name="Crop_type", abs_column="Elevation", df=None):
         """
         Apply corrections to specified columns in the DataFrame.
 
         Parameters:
         - column_name (str): The name of the column to apply corrections to. Default is 'Crop_type'.
         - abs_column (str): The name of the column for which absolute values will be taken. Default is 'Elevation'.
+        - df (pandas.DataFrame, optional): The frame to operate on. Defaults
+          to the instance DataFrame.
         """
-        self.df[abs_column] = self.df[abs_column].abs()
-        self.df[column_name] = self.df[column_name].apply(
-            lambda crop: self.values_to_rename.get(crop, crop)
+        target = self.df if df is None else df
+        # Work on the underlying ndarray to skip the pandas dispatch overhead,
+        # writing through out= so no second array is allocated. Copy-on-write
+        # can hand us a read-only view, in which case one copy is unavoidable.
+        values = target[abs_column].to_numpy(copy=False)
+        if not values.flags.writeable:
+            values = values.copy()
+        np.abs(values, out=values)
+        target[abs_column] = values
+        # Cast to categorical and correct the category labels rather than the
+        # rows: the strip/replace work becomes O(unique crop types) instead of
+        # O(rows), with a single take to rebuild the column
+        cats = target[column_name].astype("category")
+        corrected = cats.cat.categories.str.strip()
+        corrected = pd.Index([self.values_to_rename.get(c, c) for c in corrected])
+        # Corrections can merge two labels into one, so rebuild the codes
+        # against the deduplicated category set
+        new_categories = corrected.unique()
+        code_map = new_categories.get_indexer(corrected)
+        old_codes = cats.cat.codes.to_numpy()
+        new_codes = np.where(old_codes >= 0, code_map[old_codes], -1)
+        target[column_name] = pd.Categorical.from_codes(
+            new_codes, categories=new_categories
         )
-        self.df[column_name] = self.df[column_name].str.strip()
+        return target
 
-    def weather_station_mapping(self):
+    def weather_station_mapping(self, df=None):
         """
         Merge weather station mapping data with the main DataFrame.
 
+        Parameters:
+        - df (pandas.DataFrame, optional): The frame to operate on. Defaults
+          to the instance DataFrame.
+
         Returns:
         - df: DataFrame containing the merged data.
         """
-        self.df = self.df.merge(
-            read_from_web_CSV(self.weather_map_data), on="Field_ID", how="left"
-        )
-        return self.df
+        target = self.df if df is None else df
+        if self._weather_mapping_df is None:
+            # Index the lookup by Field_ID up front so the hash table is
+            # built once and reused by every map/join against it. Duplicate
+            # Field_IDs are dropped (first occurrence wins) so the index is
+            # unique: .map() raises on a duplicated index, and a fan-out join
+            # would silently multiply rows
+            self._weather_mapping_df = (
+                read_from_web_CSV(self.weather_map_data)
+                .drop(columns="Unnamed: 0", errors="ignore")
+                .drop_duplicates("Field_ID")
+                .set_index("Field_ID")
+            )
+        mapping_df = self._weather_mapping_df
+        if len(mapping_df.columns) == 1:
+            # A single mapped column is a plain lookup: a hash-indexed .map()
+            # skips the join machinery and never copies the main frame
+            target[mapping_df.columns[0]] = target["Field_ID"].map(mapping_df.iloc[:, 0])
+        else:
+            # join against the prebuilt index skips merge's key-sorting and
+            # re-hashing of the right side and keeps the left row order
+            target = target.join(mapping_df, on="Field_ID")
+        if df is None:
+            self.df = target
+        return target
+
+    def _transform(self, df):
+        """Runs the rename, correction, and mapping steps over one frame."""
+        df = df.drop(columns="Unnamed: 0", errors="ignore")
+        df = self.rename_columns(df=df)
+        df = self.apply_corrections(df=df)
+        return self.weather_station_mapping(df=df)
 
     def process(self):
         """
         Execute the data processing pipeline.
 
-        This method sequentially calls the ingest, rename, correction, and mapping methods.
+        This method sequentially calls the ingest, rename, correction, and
+        mapping methods. When 'ingest_chunk_rows' is configured, the SQL
+        result is streamed and each chunk is transformed and merged with the
+        weather map before the next chunk is fetched, so peak memory stays
+        proportional to the chunk size rather than the full result.
         """
+        if self.ingest_chunk_rows:
+            self.engine = create_db_engine(self.db_path)
+            chunks = query_data(self.engine, self.sql_query, chunksize=self.ingest_chunk_rows)
+            parts = [self._transform(chunk) for chunk in chunks]
+            # Each chunk is categorized independently, so align the category
+            # sets before concatenating; otherwise concat degrades columns
+            # with differing categories to object and the chunked path would
+            # return different dtypes than the non-chunked one
+            cat_columns = [
+                col
+                for col in parts[0].columns
+                if isinstance(parts[0][col].dtype, pd.CategoricalDtype)
+            ]
+            for col in cat_columns:
+                categories = pd.api.types.union_categoricals(
+                    [part[col] for part in parts]
+                ).categories
+                for part in parts:
+                    part[col] = part[col].cat.set_categories(categories)
+            self.df = pd.concat(parts, ignore_index=True)
+            return
         self.ingest_sql_data()
-        # Insert your code here
         self.rename_columns()
         self.apply_corrections()
         self.weather_station_mapping()
-        self.df = self.df.drop(columns="Unnamed: 0")
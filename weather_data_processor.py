@@ -1,10 +1,49 @@
 # These are the imports we're going to use in the weather data processing module
+import concurrent.futures
+import functools
+import itertools
+import os
 import re
 import numpy as np
 import pandas as pd
 import logging
 from data_ingestion import read_from_web_CSV
 
+# Below this many messages spawning worker processes costs more than it
+# saves, so the extraction runs in a single pass in the calling process.
+PARALLEL_EXTRACT_MIN_ROWS = 100_000
+
+
+def _extract_measurements_chunk(messages, patterns):
+    """Extracts (measurement, value) Series from one chunk of messages.
+
+    Module-level so ProcessPoolExecutor can pickle it; compiled patterns
+    pickle by their source and flags.
+    """
+    measurement = pd.Series(None, index=messages.index, dtype="object")
+    value = pd.Series(np.nan, index=messages.index, dtype="float64")
+    # Run each compiled pattern over the Series instead of calling
+    # re.search per row; earlier patterns win, as before. Each pass only
+    # scans the rows no earlier pattern matched, so every message is
+    # scanned roughly once in total rather than once per pattern.
+    remaining = messages
+    for key, pattern in patterns.items():
+        if remaining.empty:
+            break
+        extracted = remaining.str.extract(pattern, expand=True)
+        # Coalesce multiple capture groups into the first non-null one,
+        # column by column (row-wise bfill is orders of magnitude slower)
+        matched = functools.reduce(
+            lambda a, b: a.combine_first(b),
+            (extracted[col] for col in extracted.columns),
+        )
+        hits = matched.notna()
+        matched_index = matched.index[hits]
+        measurement[matched_index] = key
+        value[matched_index] = matched[hits].astype("float64")
+        remaining = remaining[~hits]
+    return measurement, value
+
 ### START FUNCTION
 
 
@@ -13,7 +52,16 @@ class WeatherDataProcessor:
         self, config_params, logging_level="INFO"
     ):  # Now we're passing in the confi_params dictionary already
         self.weather_station_data = config_params["weather_csv_path"]
-        self.patterns = config_params["regex_patterns"]
+        # Compile each pattern once at construction so neither the scalar nor
+        # the vectorized extraction path pays a per-call compile/lookup cost.
+        # re.ASCII keeps \d/\s/\w on the fast ASCII tables, since the station
+        # messages are plain ASCII. Patterns are tried in dict order with
+        # first-match-wins, so configs should list the most frequent
+        # measurement first to end the scan early for most rows.
+        self.patterns = {
+            key: re.compile(pattern, re.ASCII)
+            for key, pattern in config_params["regex_patterns"].items()
+        }
         self.weather_df = None  # Initialize weather_df as None or as an empty DataFrame
         self.initialize_logging(logging_level)
 
@@ -60,10 +108,39 @@ class WeatherDataProcessor:
         self.logger.debug("No measurement match found.")
         return None, None
 
+    def _extract_from_messages(self, messages):
+        return _extract_measurements_chunk(messages, self.patterns)
+
     def process_messages(self):
         if self.weather_df is not None:
-            result = self.weather_df["Message"].apply(self.extract_measurement)
-            self.weather_df["Measurement"], self.weather_df["Value"] = zip(*result)
+            messages = self.weather_df["Message"]
+            if len(messages) >= PARALLEL_EXTRACT_MIN_ROWS:
+                # Fan the extraction out over index-aligned chunks; results
+                # are concatenated back in order, so output is identical to
+                # the single-pass path. Worker processes rather than threads:
+                # re matching is CPU-bound Python that holds the GIL, so
+                # only separate interpreters actually run it in parallel.
+                n_chunks = os.cpu_count() or 1
+                bounds = np.linspace(0, len(messages), n_chunks + 1, dtype=int)
+                chunks = [
+                    messages.iloc[start:stop]
+                    for start, stop in zip(bounds[:-1], bounds[1:])
+                    if start < stop
+                ]
+                with concurrent.futures.ProcessPoolExecutor() as executor:
+                    results = list(
+                        executor.map(
+                            _extract_measurements_chunk,
+                            chunks,
+                            itertools.repeat(self.patterns),
+                        )
+                    )
+                measurement = pd.concat([m for m, _ in results])
+                value = pd.concat([v for _, v in results])
+            else:
+                measurement, value = self._extract_from_messages(messages)
+            self.weather_df["Measurement"] = measurement
+            self.weather_df["Value"] = value
             self.logger.info("Messages processed and measurements extracted.")
         else:
             self.logger.warning(